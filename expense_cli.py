@@ -6,12 +6,18 @@ Usage examples:
   python expense_cli.py add-user --name "Ishan" --email ishan@example.com
   python expense_cli.py set-budget --user 1 --category Food --year 2025 --month 12 --amount 200
   python expense_cli.py add-expense --user 1 --category Food --amount 190 --note "dinner"
+  python expense_cli.py bulk-add --file expenses.csv
   python expense_cli.py report-total --user 1 --year 2025 --month 12
   python expense_cli.py report-by-category --user 1 --year 2025 --month 12
 """
+import atexit
+import math
 import sqlite3
-import argparse
-from datetime import datetime, date
+import sys
+from datetime import date
+from types import SimpleNamespace
+# argparse, csv and json are imported inside the functions that need them to keep
+# start-up cheap for short commands
 
 DB = "expense_simple.db"
 DEFAULT_ALERT_PCT = 10.0  # percent
@@ -44,125 +50,417 @@ CREATE TABLE IF NOT EXISTS expenses (
   category TEXT NOT NULL,
   amount REAL NOT NULL,
   note TEXT,
-  date TEXT NOT NULL
+  date TEXT NOT NULL,
+  year INTEGER GENERATED ALWAYS AS (CAST(substr(date,1,4) AS INTEGER)) VIRTUAL,
+  month INTEGER GENERATED ALWAYS AS (CAST(substr(date,6,2) AS INTEGER)) VIRTUAL
 );
 """
 
+# for databases created before expenses had the generated year/month columns
+ADD_EXPENSE_YEAR = """
+ALTER TABLE expenses ADD COLUMN year INTEGER GENERATED ALWAYS AS (CAST(substr(date,1,4) AS INTEGER)) VIRTUAL;
+"""
+
+ADD_EXPENSE_MONTH = """
+ALTER TABLE expenses ADD COLUMN month INTEGER GENERATED ALWAYS AS (CAST(substr(date,6,2) AS INTEGER)) VIRTUAL;
+"""
+
+# covering index: monthly reports are answered without touching the table
+CREATE_IDX_EXP_COVER = """
+CREATE INDEX IF NOT EXISTS ix_exp_cover ON expenses(user_id, year, month, category, amount);
+"""
+
+# per (user, month, category) running totals, maintained by the triggers below
+CREATE_EXPENSE_TOTALS = """
+CREATE TABLE IF NOT EXISTS expense_totals (
+  user_id INTEGER NOT NULL,
+  year INTEGER NOT NULL,
+  month INTEGER NOT NULL,
+  category TEXT NOT NULL,
+  total REAL NOT NULL,
+  PRIMARY KEY (user_id, year, month, category)
+) WITHOUT ROWID;
+"""
+
+REBUILD_EXPENSE_TOTALS = """
+DELETE FROM expense_totals;
+INSERT INTO expense_totals (user_id, year, month, category, total)
+SELECT user_id, year, month, category, SUM(amount) FROM expenses
+GROUP BY user_id, year, month, category;
+"""
+
+CREATE_TRG_EXP_INSERT = """
+CREATE TRIGGER IF NOT EXISTS trg_exp_insert AFTER INSERT ON expenses
+BEGIN
+  INSERT INTO expense_totals (user_id, year, month, category, total)
+  VALUES (NEW.user_id, NEW.year, NEW.month, NEW.category, NEW.amount)
+  ON CONFLICT(user_id, year, month, category) DO UPDATE SET total=total+excluded.total;
+END;
+"""
+
+CREATE_TRG_EXP_DELETE = """
+CREATE TRIGGER IF NOT EXISTS trg_exp_delete AFTER DELETE ON expenses
+BEGIN
+  UPDATE expense_totals SET total=total-OLD.amount
+  WHERE user_id=OLD.user_id AND year=OLD.year AND month=OLD.month AND category=OLD.category;
+END;
+"""
+
+CREATE_TRG_EXP_UPDATE = """
+CREATE TRIGGER IF NOT EXISTS trg_exp_update AFTER UPDATE OF user_id, category, amount, date ON expenses
+BEGIN
+  UPDATE expense_totals SET total=total-OLD.amount
+  WHERE user_id=OLD.user_id AND year=OLD.year AND month=OLD.month AND category=OLD.category;
+  INSERT INTO expense_totals (user_id, year, month, category, total)
+  VALUES (NEW.user_id, NEW.year, NEW.month, NEW.category, NEW.amount)
+  ON CONFLICT(user_id, year, month, category) DO UPDATE SET total=total+excluded.total;
+END;
+"""
+
+# DDL applied as scripts; the year/month ALTERs for older databases go in between
+SCHEMA_SQL = CREATE_USERS + CREATE_BUDGETS + CREATE_EXPENSES
+INDEXES_SQL = (CREATE_IDX_EXP_COVER + CREATE_EXPENSE_TOTALS + REBUILD_EXPENSE_TOTALS
+               + CREATE_TRG_EXP_INSERT + CREATE_TRG_EXP_DELETE + CREATE_TRG_EXP_UPDATE)
+
+# bumped whenever an existing database needs DDL applied on connect (PRAGMA user_version)
+SCHEMA_VERSION = 2
+
+
+SQL_INSERT_USER = "INSERT INTO users (name, email) VALUES (?, ?)"
+
+# single UPSERT keyed on the UNIQUE(user_id, category, year, month) constraint
+SQL_UPSERT_BUDGET = """
+INSERT INTO budgets (user_id, category, year, month, amount, alert_pct)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(user_id, category, year, month)
+DO UPDATE SET amount=excluded.amount, alert_pct=excluded.alert_pct
+RETURNING id
+"""
+
+SQL_INSERT_EXPENSE = """
+INSERT INTO expenses (user_id, category, amount, note, date)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+# budget and month-to-date spend in one round-trip; no row means no budget
+SQL_ALERT_CHECK = """
+SELECT b.amount, b.alert_pct, COALESCE(t.total,0) FROM budgets b
+LEFT JOIN expense_totals t
+  ON t.user_id=b.user_id AND t.year=b.year AND t.month=b.month AND t.category=b.category
+WHERE b.user_id=? AND b.category=? AND b.year=? AND b.month=?
+"""
+
+# budget vs. spend for exactly the (user, category, year, month) keys a batch touched,
+# passed as a JSON array of [user, category, year, month] arrays
+SQL_BULK_ALERTS = """
+WITH k AS (
+  SELECT json_extract(value,'$[0]') AS user_id, json_extract(value,'$[1]') AS category,
+         json_extract(value,'$[2]') AS year, json_extract(value,'$[3]') AS month
+  FROM json_each(?)
+)
+SELECT b.user_id, b.category, b.year, b.month, b.amount, b.alert_pct, t.total
+FROM k
+JOIN budgets b
+  ON b.user_id=k.user_id AND b.category=k.category AND b.year=k.year AND b.month=k.month
+JOIN expense_totals t
+  ON t.user_id=b.user_id AND t.year=b.year AND t.month=b.month AND t.category=b.category
+ORDER BY b.user_id, b.year, b.month, b.category
+"""
+
+SQL_REPORT_TOTAL = """
+SELECT COALESCE(SUM(total),0) FROM expense_totals
+WHERE user_id=? AND year=? AND month=?
+"""
+
+# spent categories (with budget if any) followed by budgets with no spending
+SQL_REPORT_BY_CATEGORY = """
+WITH spent AS (
+  SELECT category, SUM(amount) AS s FROM expenses
+  WHERE user_id=? AND year=? AND month=?
+  GROUP BY category
+),
+bud AS (
+  SELECT category, amount FROM budgets
+  WHERE user_id=? AND year=? AND month=?
+)
+SELECT s.category, s.s, b.amount, 0 AS ord FROM spent s
+LEFT JOIN bud b USING(category)
+UNION ALL
+SELECT b.category, 0, b.amount, 1 AS ord FROM bud b
+LEFT JOIN spent s USING(category)
+WHERE s.category IS NULL
+ORDER BY ord, 1
+"""
+
+
+_CONN = None
+
 
 def get_conn():
-    return sqlite3.connect(DB)
+    # one connection per process; PRAGMAs are applied once on creation
+    global _CONN
+    if _CONN is None:
+        conn = sqlite3.connect(DB, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        atexit.register(conn.close)
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            upgrade_schema(conn)
+        _CONN = conn
+    return _CONN
+
+
+def upgrade_schema(conn):
+    """Create missing tables, columns, indexes and triggers, and rebuild expense_totals."""
+    # empty when the table does not exist yet, in which case CREATE_EXPENSES has the columns
+    cols = {r[1] for r in conn.execute("PRAGMA table_xinfo(expenses)")}
+    script = SCHEMA_SQL
+    if cols and "year" not in cols:
+        script += ADD_EXPENSE_YEAR
+    if cols and "month" not in cols:
+        script += ADD_EXPENSE_MONTH
+    conn.executescript("BEGIN;" + script + INDEXES_SQL
+                       + f"PRAGMA user_version={SCHEMA_VERSION};" + "COMMIT;")
 
 
 def init_db(args):
-    with get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute(CREATE_USERS)
-        cur.execute(CREATE_BUDGETS)
-        cur.execute(CREATE_EXPENSES)
-        conn.commit()
-    print(f"Initialized database `{DB}` (tables: users, budgets, expenses).")
+    # get_conn() already upgrades new or older databases; run it again so init
+    # always rebuilds expense_totals from expenses
+    upgrade_schema(get_conn())
+    print(f"Initialized database `{DB}` (tables: users, budgets, expenses, expense_totals).")
 
 
 def add_user(args):
-    with get_conn() as conn:
+    conn = get_conn()
+    with conn:
         cur = conn.cursor()
-        cur.execute("INSERT INTO users (name, email) VALUES (?, ?)", (args.name, args.email))
-        conn.commit()
+        cur.execute(SQL_INSERT_USER, (args.name, args.email))
         uid = cur.lastrowid
     print(f"Created user id={uid}, name={args.name}, email={args.email}")
 
 
 def set_budget(args):
-    with get_conn() as conn:
+    conn = get_conn()
+    with conn:
         cur = conn.cursor()
-        # try update first
-        cur.execute("""SELECT id FROM budgets WHERE user_id=? AND category=? AND year=? AND month=?""",
-                    (args.user, args.category, args.year, args.month))
-        row = cur.fetchone()
-        if row:
-            cur.execute("""UPDATE budgets SET amount=?, alert_pct=? WHERE id=?""",
-                        (args.amount, args.alert_pct, row[0]))
-            print(f"Updated budget id={row[0]}")
-        else:
-            cur.execute("""INSERT INTO budgets (user_id, category, year, month, amount, alert_pct)
-                           VALUES (?, ?, ?, ?, ?, ?)""",
-                        (args.user, args.category, args.year, args.month, args.amount, args.alert_pct))
-            print(f"Inserted budget id={cur.lastrowid}")
-        conn.commit()
+        cur.execute(SQL_UPSERT_BUDGET,
+                    (args.user, args.category, args.year, args.month, args.amount, args.alert_pct))
+        (bid,) = cur.fetchone()
+    print(f"Saved budget id={bid}")
+
+
+def alert_level(budget_amount, alert_pct, spent):
+    """Return 2 if the budget is exceeded, 1 if it is running low, else 0."""
+    if alert_pct is None:
+        alert_pct = DEFAULT_ALERT_PCT
+    if spent > budget_amount:
+        return 2
+    remaining = max(budget_amount - spent, 0.0)
+    remaining_pct = (remaining / budget_amount) * 100 if budget_amount > 0 else 0.0
+    return 1 if remaining_pct <= alert_pct else 0
+
+
+def budget_alert(category, budget_amount, alert_pct, spent):
+    """Return the warning/alert line for a budget, or None if within limits."""
+    level = alert_level(budget_amount, alert_pct, spent)
+    if level == 2:
+        return f"WARNING: Budget exceeded for {category} — spent {spent:.2f}, budget {budget_amount:.2f}"
+    if level == 1:
+        remaining = budget_amount - spent
+        remaining_pct = (remaining / budget_amount) * 100 if budget_amount > 0 else 0.0
+        return f"ALERT: Low budget remaining for {category} — remaining {remaining:.2f} ({remaining_pct:.1f}% left)"
+    return None
 
 
 def add_expense(args):
-    d = args.date or date.today().isoformat()
-    with get_conn() as conn:
+    # validate before inserting, regardless of --quiet/--no-alert
+    try:
+        day = date.fromisoformat(args.date) if args.date else date.today()
+    except ValueError:
+        raise SystemExit(f"Invalid --date {args.date!r}: expected YYYY-MM-DD")
+    d = day.isoformat()
+    conn = get_conn()
+    with conn:
         cur = conn.cursor()
-        cur.execute("""INSERT INTO expenses (user_id, category, amount, note, date)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (args.user, args.category, args.amount, args.note, d))
-        conn.commit()
+        cur.execute(SQL_INSERT_EXPENSE, (args.user, args.category, args.amount, args.note, d))
         eid = cur.lastrowid
-        print(f"Added expense id={eid}: user={args.user} category={args.category} amount={args.amount} date={d}")
-        # check budget & alert
-        year = int(d.split("-")[0])
-        month = int(d.split("-")[1])
-        cur.execute("""SELECT amount, alert_pct FROM budgets
-                       WHERE user_id=? AND category=? AND year=? AND month=?""",
-                    (args.user, args.category, year, month))
-        b = cur.fetchone()
-        if b:
-            budget_amount, alert_pct = b[0], (b[1] if b[1] is not None else DEFAULT_ALERT_PCT)
-            cur.execute("""SELECT COALESCE(SUM(amount),0) FROM expenses
-                           WHERE user_id=? AND category=? AND substr(date,1,4)=? AND substr(date,6,2)=?""",
-                        (args.user, args.category, str(year), f"{month:02d}"))
-            spent = cur.fetchone()[0] or 0.0
-            remaining = max(budget_amount - spent, 0.0)
-            remaining_pct = (remaining / budget_amount) * 100 if budget_amount > 0 else 0.0
-            if spent > budget_amount:
-                print(f"WARNING: Budget exceeded for {args.category} — spent {spent:.2f}, budget {budget_amount:.2f}")
-            elif remaining_pct <= alert_pct:
-                print(f"ALERT: Low budget remaining for {args.category} — remaining {remaining:.2f} ({remaining_pct:.1f}% left)")
+        if args.quiet:
+            return
+        out = f"Added expense id={eid}: user={args.user} category={args.category} amount={args.amount} date={d}"
+        if not args.no_alert:
+            # check budget & alert
+            cur.execute(SQL_ALERT_CHECK, (args.user, args.category, day.year, day.month))
+            b = cur.fetchone()
+            if b:
+                budget_amount, alert_pct, spent = b
+                msg = budget_alert(args.category, budget_amount, alert_pct, spent)
+                if msg:
+                    out += "\n" + msg
+            else:
+                out += "\nNo budget set for this category/month (no alerts)."
+    print(out)
+
+
+def is_jsonl(path):
+    return path.endswith((".jsonl", ".json"))
+
+
+def read_expense_rows(path):
+    """Yield (line number, expense dict) from a CSV (with header) or JSONL file."""
+    import csv
+    import json
+    try:
+        # utf-8-sig drops the BOM spreadsheet programs put in front of the header
+        f = open(path, newline="", encoding="utf-8-sig")
+    except OSError as e:
+        raise SystemExit(f"{path}: {e.strerror}")
+    with f:
+        if is_jsonl(path):
+            for lineno, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        yield lineno, json.loads(line)
+                    except ValueError as e:
+                        raise SystemExit(f"{path}:{lineno}: invalid JSON: {e}")
         else:
-            print("No budget set for this category/month (no alerts).")
+            reader = csv.DictReader(f)
+            for r in reader:
+                yield reader.line_num, r
+
+
+def parse_user_id(value, from_csv):
+    """Return a user id from a JSON integer or a CSV digit string; ValueError otherwise."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if from_csv and value.strip().isdigit():
+        return int(value)
+    raise ValueError(f"user must be an integer, got {value!r}")
+
+
+def bulk_add(args):
+    today = date.today().isoformat()
+    added = {}  # (user, category, year, month) -> amount added by this batch
+    from_csv = not is_jsonl(args.file)
+
+    def rows():
+        for lineno, r in read_expense_rows(args.file):
+            try:
+                user, category = parse_user_id(r["user"], from_csv), r["category"]
+                if category is None or not str(category).strip():
+                    raise ValueError("category must not be empty")
+                # stored (and read back) as TEXT, so key alerts on the same form
+                category = str(category)
+                amount = float(r["amount"])
+                if not math.isfinite(amount):
+                    raise ValueError(f"amount must be a finite number, got {r['amount']!r}")
+                day = date.fromisoformat(r.get("date") or today)
+                note = r.get("note") or ""
+            except KeyError as e:
+                raise SystemExit(f"{args.file}:{lineno}: missing field {e}")
+            except (AttributeError, TypeError, ValueError) as e:
+                raise SystemExit(f"{args.file}:{lineno}: invalid expense row: {e}")
+            key = (user, category, day.year, day.month)
+            added[key] = added.get(key, 0.0) + amount
+            yield (user, category, amount, note, day.isoformat())
+
+    conn = get_conn()
+    with conn:
+        cur = conn.cursor()
+        cur.executemany(SQL_INSERT_EXPENSE, rows())
+        n = cur.rowcount
+    print(f"Added {n} expenses from {args.file}")
+    if not added:
+        return
+
+    # one alert pass over the touched keys instead of per-row checks; only report
+    # budgets whose alert level went up because of this batch
+    import json
+    for user, category, year, month, budget_amount, alert_pct, spent in cur.execute(
+            SQL_BULK_ALERTS, (json.dumps(list(added)),)):
+        before = spent - added[(user, category, year, month)]
+        if alert_level(budget_amount, alert_pct, spent) > alert_level(budget_amount, alert_pct, before):
+            print(f"[user {user} {year}-{month:02d}] {budget_alert(category, budget_amount, alert_pct, spent)}")
 
 
 def report_total(args):
-    with get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute("""SELECT COALESCE(SUM(amount),0) FROM expenses
-                       WHERE user_id=? AND substr(date,1,4)=? AND substr(date,6,2)=?""",
-                    (args.user, str(args.year), f"{args.month:02d}"))
-        total = cur.fetchone()[0] or 0.0
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(SQL_REPORT_TOTAL, (args.user, args.year, args.month))
+    (total,) = cur.fetchone()
     print(f"Total spending for user {args.user} in {args.year}-{args.month:02d}: {total:.2f}")
 
 
 def report_by_category(args):
-    with get_conn() as conn:
-        cur = conn.cursor()
-        cur.execute("""SELECT category, COALESCE(SUM(amount),0) FROM expenses
-                       WHERE user_id=? AND substr(date,1,4)=? AND substr(date,6,2)=?
-                       GROUP BY category""",
-                    (args.user, str(args.year), f"{args.month:02d}"))
-        rows = cur.fetchall()
-        print(f"Spending by category for user {args.user} in {args.year}-{args.month:02d}:")
-        for cat, amt in rows:
-            # find budget if any
-            cur.execute("""SELECT amount FROM budgets WHERE user_id=? AND category=? AND year=? AND month=?""",
-                        (args.user, cat, args.year, args.month))
-            b = cur.fetchone()
-            b_amt = b[0] if b else None
-            print(f"  {cat}: spent {amt:.2f}" + (f", budget {b_amt:.2f}" if b_amt is not None else ""))
-
-        # Also show budgets that had no spending
-        cur.execute("""SELECT category, amount FROM budgets
-                       WHERE user_id=? AND year=? AND month=?""",
-                    (args.user, args.year, args.month))
-        budgets = cur.fetchall()
-        spent_cats = {r[0] for r in rows}
-        for cat, bamt in budgets:
-            if cat not in spent_cats:
-                print(f"  {cat}: spent 0.00, budget {bamt:.2f}")
+    conn = get_conn()
+    cur = conn.cursor()
+    cur.execute(SQL_REPORT_BY_CATEGORY, (args.user, args.year, args.month, args.user, args.year, args.month))
+    out = [f"Spending by category for user {args.user} in {args.year}-{args.month:02d}:"]
+    out.extend(f"  {cat}: spent {amt:.2f}" + (f", budget {b_amt:.2f}" if b_amt is not None else "")
+               for cat, amt, b_amt, _ in cur)
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+# command -> (handler, option types, defaults for optional dests); dests without a
+# default are required, and options typed `bool` are value-less store_true flags.
+# Mirrors parse_args() for the plain `--key value` form; anything else falls back to it.
+HANDLERS = {
+    "init": (init_db, {}, {}),
+    "add-user": (add_user, {"--name": str, "--email": str}, {"email": None}),
+    "set-budget": (set_budget,
+                   {"--user": int, "--category": str, "--year": int, "--month": int,
+                    "--amount": float, "--alert-pct": float},
+                   {"alert_pct": None}),
+    "add-expense": (add_expense,
+                    {"--user": int, "--category": str, "--amount": float, "--note": str, "--date": str,
+                     "--quiet": bool, "--no-alert": bool},
+                    {"note": "", "date": None, "quiet": False, "no_alert": False}),
+    "bulk-add": (bulk_add, {"--file": str}, {}),
+    "report-total": (report_total, {"--user": int, "--year": int, "--month": int}, {}),
+    "report-by-category": (report_by_category, {"--user": int, "--year": int, "--month": int}, {}),
+}
+
+
+def _is_negative_number(raw):
+    """Match argparse's negative-number rule (-N or -N.N / -.N), so such values are not options."""
+    if not raw.startswith("-"):
+        return False
+    head, sep, tail = raw[1:].partition(".")
+    if not sep:
+        return head.isdigit()
+    return (not head or head.isdigit()) and tail.isdigit()
+
+
+def fast_parse(argv):
+    """Parse well-formed `cmd --key value ...` argv without argparse; None means fall back."""
+    if not argv or argv[0] not in HANDLERS:
+        return None
+    func, types, defaults = HANDLERS[argv[0]]
+    values = dict(defaults)
+    it = iter(argv[1:])
+    for opt in it:
+        conv = types.get(opt)
+        if conv is bool:
+            values[opt[2:].replace("-", "_")] = True
+            continue
+        raw = next(it, None)
+        # argparse reads any other dash-prefixed value as an option, so let it decide
+        if conv is None or raw is None or raw.startswith("-") and not _is_negative_number(raw):
+            return None
+        try:
+            values[opt[2:].replace("-", "_")] = conv(raw)
+        except ValueError:
+            return None
+    required = {o[2:].replace("-", "_") for o in types} - set(defaults)
+    if not required <= values.keys() or not 1 <= values.get("month", 1) <= 12:
+        return None
+    return SimpleNamespace(cmd=argv[0], func=func, **values)
 
 
 def parse_args():
+    import argparse
     p = argparse.ArgumentParser(description="Simple Expense Tracker CLI")
     sub = p.add_subparsers(dest="cmd", required=True)
 
@@ -189,8 +487,15 @@ def parse_args():
     pe.add_argument("--amount", type=float, required=True)
     pe.add_argument("--note", default="")
     pe.add_argument("--date", default=None, help="YYYY-MM-DD (optional; default today)")
+    pe.add_argument("--quiet", action="store_true", help="print nothing and skip the budget check")
+    pe.add_argument("--no-alert", action="store_true", dest="no_alert", help="skip the budget check")
     pe.set_defaults(func=add_expense)
 
+    pe2 = sub.add_parser("bulk-add")
+    pe2.add_argument("--file", required=True,
+                     help="CSV with header user,category,amount,note,date or JSONL with the same keys")
+    pe2.set_defaults(func=bulk_add)
+
     pr1 = sub.add_parser("report-total")
     pr1.add_argument("--user", type=int, required=True)
     pr1.add_argument("--year", type=int, required=True)
@@ -207,7 +512,7 @@ def parse_args():
 
 
 def main():
-    args = parse_args()
+    args = fast_parse(sys.argv[1:]) or parse_args()
     args.func(args)
 
 